@@ -1,183 +1,313 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import aiohttp
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+from selectolax.lexbor import LexborHTMLParser
 import json
 import csv
 import time
 import os
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 import re
+import textwrap
+
+# Patterns used on every product page, compiled once at import time
+_PRICE_STRIP_RE = re.compile(r'[^\d.,]')
+_SKU_PREFIX_RE = re.compile(r'^SKU:?\s*', re.IGNORECASE)
+_PRICE_FIND_RE = re.compile(r'\$\d+(?:\.\d{2})?')
+_SKU_FIND_RE = re.compile(r'SKU:?\s*([A-Za-z0-9-]+)')
+_PAGE_RE = re.compile(r'page=(\d+)')
+
+# Field selectors, OR-joined so each field costs a single css_first() call.
+# A compound selector returns the first match in document order, not the first
+# listed selector, so catch-alls and container classes that can wrap a more
+# specific match are kept out of these and tried in order only when the
+# specific selectors miss.
+_TITLE_SEL = ', '.join([
+    'h1.product-title',
+    'h1.title',
+    'h1.product-single__title',
+    'h1[itemprop="name"]',
+    '.product-title h1',
+    '#product-title'
+])
+_PRICE_SEL = ', '.join([
+    'span.price-new',
+    'span[itemprop="price"]',
+    '#product-price',
+    'div.price-box span.regular-price'
+])
+_GENERIC_PRICE_SELECTORS = (
+    '.price',
+    '.product-price',
+    '.product-single__price'
+)
+_ORIGINAL_PRICE_SEL = ', '.join([
+    'span.price-old',
+    '.compare-price',
+    '.product-single__price--compare',
+    '.was-price',
+    'span.old-price'
+])
+_SKU_SEL = ', '.join([
+    'div.sku',
+    '.product-sku',
+    'span[itemprop="sku"]',
+    '.product-single__sku'
+])
+_DESCRIPTION_SEL = ', '.join([
+    'div.product-description',
+    '#product-description',
+    'div[itemprop="description"]',
+    '.product-single__description'
+])
+_GENERIC_DESCRIPTION_SELECTORS = (
+    '.description',
+    '.product-description-container'
+)
+_PRODUCT_IMAGE_SEL = ', '.join([
+    'img[src*="product" i]',
+    'img[src*="item" i]',
+    'img[data-src*="product" i]',
+    'img[data-src*="item" i]'
+])
+# Product cards, in priority order: the first selector that matches anything
+# wins, so a "related products" widget alongside the main grid, or the generic
+# layout classes at the end, are only used when nothing more specific is found
+_PRODUCT_CARD_SELECTORS = (
+    'div.product-layout div.product-thumb',
+    '.product-grid .product-card',
+    '.collection-grid .grid-product',
+    '.products-grid .product-item',
+    '.product-list .product',
+    'ul.products li.product',
+    '.grid-product__content',
+    'article[data-product]',
+    '.product-item',
+    '.grid__item',
+    '.product-card'
+)
+# Next-page links: the pagination-specific structures are OR-joined, while the
+# generic link classes (which also match e.g. slider arrows) are tried in order
+# only when none of them yields a link
+_NEXT_LINK_SEL = ', '.join([
+    'ul.pagination li.active + li a',
+    '.pagination .next a',
+    'a.pagination__next',
+    '.next-page a',
+    '.pagination-next a'
+])
+_GENERIC_NEXT_LINK_SELECTORS = (
+    'a[rel="next"]',
+    'a.next',
+    'a.next-page',
+    '.pagination .next'
+)
+# Spec cells: the structural cell selectors are OR-joined, while the inline
+# 'strong'/'span' fallbacks are tried separately so one nested inside the
+# name cell can't be picked ahead of the real value cell
+_SPEC_NAME_SEL = 'div.col-sm-4, th, td:first-child'
+_SPEC_VALUE_SEL = 'div.col-sm-8, td:last-child'
+
+def _css_first_of(node, selectors):
+    """Return the first match of the first selector that matches anything"""
+    for selector in selectors:
+        match = node.css_first(selector)
+        if match:
+            return match
+    return None
 
 class JenniferFurnitureScraper:
     def __init__(self, base_url="https://www.jenniferfurniture.com/"):
         self.base_url = base_url
+        base_parts = urlsplit(base_url)
+        self._base_scheme = base_parts.scheme
+        self._base_origin = f"{base_parts.scheme}://{base_parts.netloc}"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept-Language': 'en-US,en;q=0.9',
         }
+        # Pooled keep-alive session, opened on first fetch and released by close()
+        self.session = None
         self.all_products = []
         self.debug = True  # Set to True to print debug information
+        self.max_concurrency = 16  # Number of product pages fetched concurrently
+        self.max_retries = 3  # Retries on connection errors and timeouts
+        self.request_interval = 1.0  # Minimum seconds between request starts
+        self.cache_name = 'jf_cache'  # On-disk response cache; None disables it
+        self.cache_expire_after = 86400  # Seconds before a cached page is refetched
+        self._fetch_semaphore = None
+        self._rate_lock = asyncio.Lock()
+        self._next_request_time = 0.0
     
-    def debug_print(self, message):
-        """Print debug information if debug mode is enabled"""
+    def debug_print(self, message, *args):
+        """Print debug information if debug mode is enabled
+        
+        message is %-formatted with args only when debug mode is on, so
+        disabled debug calls cost no string formatting.
+        """
         if self.debug:
-            print(f"DEBUG: {message}")
+            print(f"DEBUG: {message % args if args else message}")
     
-    def get_page_html(self, url):
-        """Fetch HTML content of the specified URL"""
-        try:
-            self.debug_print(f"Fetching URL: {url}")
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.text
-        except requests.RequestException as e:
-            print(f"Error fetching page {url}: {e}")
-            return None
+    def _absolute_url(self, url):
+        """Resolve url against base_url, skipping urljoin for the common cases"""
+        if url.startswith(('http://', 'https://')):
+            return url
+        if url.startswith('//'):
+            return f"{self._base_scheme}:{url}"
+        if url.startswith('/') and '/.' not in url:
+            # Dot segments need urljoin's path normalisation
+            return self._base_origin + url
+        return urljoin(self.base_url, url)
+    
+    def open_session(self):
+        """Create the pooled, optionally disk-cached HTTP session used by get_page_html"""
+        connector = aiohttp.TCPConnector(limit=32, limit_per_host=16)
+        timeout = aiohttp.ClientTimeout(total=10)
+        if not self.cache_name:
+            return aiohttp.ClientSession(headers=self.headers, connector=connector, timeout=timeout)
+        cache = SQLiteBackend(cache_name=self.cache_name, expire_after=self.cache_expire_after)
+        return CachedSession(cache=cache, headers=self.headers, connector=connector, timeout=timeout)
+    
+    async def close(self):
+        """Close the HTTP session opened by get_page_html, if any"""
+        if self.session:
+            await self.session.close()
+        self.session = None
+        self._fetch_semaphore = None
+    
+    async def __aenter__(self):
+        return self
     
-    def parse_product_page(self, product_url):
-        """Extract details from a product page"""
-        html = self.get_page_html(product_url)
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def _has_fresh_cache_entry(self, url):
+        """Return True if url will be served from the cache without a request"""
+        if not isinstance(self.session, CachedSession):
+            return False
+        # has_url() also counts expired entries, which would still hit the
+        # network; get_response() only returns unexpired ones
+        cache = self.session.cache
+        return await cache.get_response(cache.create_key('GET', url)) is not None
+    
+    async def wait_for_request_slot(self):
+        """Wait until the next request may start, spacing requests across tasks"""
+        async with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_time)
+            self._next_request_time = start + self.request_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+    
+    async def get_page_html(self, url):
+        """Fetch HTML content of the specified URL
+        
+        The session is opened on first use; call close() (or use the scraper as
+        an async context manager) to release it when fetching outside
+        scrape_multiple_pages.
+        """
+        if self.session is None:
+            self.session = self.open_session()
+            self._fetch_semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._fetch_semaphore:
+            # Cached pages never reach the server, so they skip the rate limit
+            cached = await self._has_fresh_cache_entry(url)
+            for attempt in range(self.max_retries + 1):
+                if not cached:
+                    await self.wait_for_request_slot()
+                try:
+                    self.debug_print("Fetching URL: %s", url)
+                    async with self.session.get(url) as response:
+                        response.raise_for_status()
+                        # Be as lenient as requests was with mis-declared charsets
+                        return await response.text(errors='replace')
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    if attempt == self.max_retries:
+                        print(f"Error fetching page {url}: {e!r}")
+                        return None
+                    await asyncio.sleep(0.3 * 2 ** attempt)
+                except aiohttp.ClientError as e:
+                    print(f"Error fetching page {url}: {e}")
+                    return None
+    
+    async def parse_product_page(self, product_url):
+        """Fetch a product page and extract its details"""
+        html = await self.get_page_html(product_url)
         if not html:
             return None
         
-        soup = BeautifulSoup(html, 'html.parser')
+        # Parsing is CPU-bound, so keep it off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.extract_product, product_url, html)
+    
+    def extract_product(self, product_url, html):
+        """Extract details from the HTML of a product page"""
+        tree = LexborHTMLParser(html)
         
-        self.debug_print(f"Parsing product page: {product_url}")
+        self.debug_print("Parsing product page: %s", product_url)
         
         # Extract product details
         product = {}
         
         # Title
-        title_selectors = [
-            'h1.product-title',
-            'h1.title',
-            'h1.product-single__title',
-            'h1[itemprop="name"]',
-            '.product-title h1',
-            '#product-title'
-        ]
-        
-        for selector in title_selectors:
-            title_elem = soup.select_one(selector)
-            if title_elem:
-                product['title'] = title_elem.text.strip()
-                self.debug_print(f"Found title: {product['title']} using selector: {selector}")
-                break
-        
-        if 'title' not in product:
-            # Try to find any h1 that might contain the title
-            h1_elems = soup.find_all('h1')
-            if h1_elems:
-                product['title'] = h1_elems[0].text.strip()
-                self.debug_print(f"Found title using generic h1: {product['title']}")
-            else:
-                product['title'] = "N/A"
-                self.debug_print("No title found")
+        title_elem = tree.css_first(_TITLE_SEL) or tree.css_first('h1')
+        if title_elem:
+            product['title'] = title_elem.text().strip()
+            self.debug_print("Found title: %s", product['title'])
+        else:
+            product['title'] = "N/A"
+            self.debug_print("No title found")
         
         # Price
-        price_selectors = [
-            'span.price-new',
-            '.price',
-            '.product-price',
-            'span[itemprop="price"]',
-            '.product-single__price',
-            '#product-price',
-            'div.price-box span.regular-price'
-        ]
-        
-        for selector in price_selectors:
-            price_elem = soup.select_one(selector)
-            if price_elem:
-                price_text = price_elem.text.strip()
-                # Clean up price text (remove non-price characters)
-                price_text = re.sub(r'[^\d.,]', '', price_text)
-                product['price'] = price_text
-                self.debug_print(f"Found price: {product['price']} using selector: {selector}")
-                break
-        
-        if 'price' not in product:
-            # Try to find price using common patterns
-            price_pattern = re.compile(r'(\$\d+(?:\.\d{2})?)')
-            price_matches = price_pattern.findall(str(soup))
-            if price_matches:
-                product['price'] = price_matches[0]
-                self.debug_print(f"Found price using regex: {product['price']}")
+        price_elem = tree.css_first(_PRICE_SEL) or _css_first_of(tree, _GENERIC_PRICE_SELECTORS)
+        if price_elem:
+            # Clean up price text (remove non-price characters)
+            product['price'] = _PRICE_STRIP_RE.sub('', price_elem.text().strip())
+            self.debug_print("Found price: %s", product['price'])
+        else:
+            # Try to find price using common patterns in the raw page source
+            price_match = _PRICE_FIND_RE.search(html)
+            if price_match:
+                product['price'] = price_match.group(0)
+                self.debug_print("Found price using regex: %s", product['price'])
             else:
                 product['price'] = "N/A"
                 self.debug_print("No price found")
         
         # Original price if on sale
-        original_price_selectors = [
-            'span.price-old',
-            '.compare-price',
-            '.product-single__price--compare',
-            '.was-price',
-            'span.old-price'
-        ]
-        
-        for selector in original_price_selectors:
-            orig_price_elem = soup.select_one(selector)
-            if orig_price_elem:
-                orig_price_text = orig_price_elem.text.strip()
-                # Clean up price text
-                orig_price_text = re.sub(r'[^\d.,]', '', orig_price_text)
-                product['original_price'] = orig_price_text
-                self.debug_print(f"Found original price: {product['original_price']} using selector: {selector}")
-                break
-        
-        if 'original_price' not in product:
+        orig_price_elem = tree.css_first(_ORIGINAL_PRICE_SEL)
+        if orig_price_elem:
+            product['original_price'] = _PRICE_STRIP_RE.sub('', orig_price_elem.text().strip())
+            self.debug_print("Found original price: %s", product['original_price'])
+        else:
             product['original_price'] = product.get('price', 'N/A')
         
         # SKU
-        sku_selectors = [
-            'div.sku',
-            '.product-sku',
-            'span[itemprop="sku"]',
-            '.product-single__sku'
-        ]
-        
-        for selector in sku_selectors:
-            sku_elem = soup.select_one(selector)
-            if sku_elem:
-                sku_text = sku_elem.text.strip()
-                # Clean up SKU text (remove "SKU:" prefix)
-                sku_text = re.sub(r'^SKU:?\s*', '', sku_text, flags=re.IGNORECASE)
-                product['sku'] = sku_text
-                self.debug_print(f"Found SKU: {product['sku']} using selector: {selector}")
-                break
-        
-        if 'sku' not in product:
-            # Try to find SKU in the page source
-            sku_pattern = re.compile(r'SKU:?\s*([A-Za-z0-9-]+)')
-            sku_matches = sku_pattern.findall(str(soup))
-            if sku_matches:
-                product['sku'] = sku_matches[0]
-                self.debug_print(f"Found SKU using regex: {product['sku']}")
+        sku_elem = tree.css_first(_SKU_SEL)
+        if sku_elem:
+            # Clean up SKU text (remove "SKU:" prefix)
+            product['sku'] = _SKU_PREFIX_RE.sub('', sku_elem.text().strip())
+            self.debug_print("Found SKU: %s", product['sku'])
+        else:
+            # Try to find SKU in the raw page source
+            sku_match = _SKU_FIND_RE.search(html)
+            if sku_match:
+                product['sku'] = sku_match.group(1)
+                self.debug_print("Found SKU using regex: %s", product['sku'])
             else:
                 product['sku'] = "N/A"
                 self.debug_print("No SKU found")
         
         # Description
-        description_selectors = [
-            'div.product-description',
-            '.description',
-            '#product-description',
-            'div[itemprop="description"]',
-            '.product-single__description',
-            '.product-description-container'
-        ]
-        
-        for selector in description_selectors:
-            desc_elem = soup.select_one(selector)
-            if desc_elem:
-                product['description'] = desc_elem.text.strip()
-                self.debug_print(f"Found description using selector: {selector}")
-                break
-        
-        if 'description' not in product:
+        desc_elem = tree.css_first(_DESCRIPTION_SEL) or _css_first_of(tree, _GENERIC_DESCRIPTION_SELECTORS)
+        if desc_elem:
+            product['description'] = desc_elem.text().strip()
+            self.debug_print("Found description")
+        else:
             # Try to find description in meta tags
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            if meta_desc and meta_desc.get('content'):
-                product['description'] = meta_desc.get('content')
+            meta_desc = tree.css_first('meta[name="description"]')
+            if meta_desc and meta_desc.attributes.get('content'):
+                product['description'] = meta_desc.attributes.get('content')
                 self.debug_print("Found description in meta tag")
             else:
                 product['description'] = "N/A"
@@ -197,25 +327,25 @@ class JenniferFurnitureScraper:
         product['images'] = []
         
         for selector in image_selectors:
-            image_elems = soup.select(selector)
+            image_elems = tree.css(selector)
             if image_elems:
                 for img in image_elems:
-                    img_url = img.get('src') or img.get('data-src')
+                    img_url = img.attributes.get('src') or img.attributes.get('data-src')
                     if img_url:
-                        full_img_url = urljoin(self.base_url, img_url)
+                        full_img_url = self._absolute_url(img_url)
                         product['images'].append(full_img_url)
-                self.debug_print(f"Found {len(product['images'])} images using selector: {selector}")
+                self.debug_print("Found %s images using selector: %s", len(product['images']), selector)
                 break
         
         if not product['images']:
-            # Try to find any image in the product area
-            all_images = soup.find_all('img')
-            for img in all_images:
-                img_url = img.get('src') or img.get('data-src')
+            # Try to find any product-looking image; the selector filters in
+            # Lexbor, the check below keeps src taking precedence over data-src
+            for img in tree.css(_PRODUCT_IMAGE_SEL):
+                img_url = img.attributes.get('src') or img.attributes.get('data-src')
                 if img_url and ('product' in img_url.lower() or 'item' in img_url.lower()):
-                    full_img_url = urljoin(self.base_url, img_url)
+                    full_img_url = self._absolute_url(img_url)
                     product['images'].append(full_img_url)
-            self.debug_print(f"Found {len(product['images'])} images using generic image search")
+            self.debug_print("Found %s images using generic image search", len(product['images']))
         
         # Specifications/Details
         specs = {}
@@ -228,18 +358,18 @@ class JenniferFurnitureScraper:
         ]
         
         for selector in spec_selectors:
-            spec_elems = soup.select(selector)
+            spec_elems = tree.css(selector)
             if spec_elems:
                 for spec in spec_elems:
-                    name_elem = spec.select_one('div.col-sm-4') or spec.select_one('th') or spec.select_one('td:first-child') or spec.select_one('strong')
-                    value_elem = spec.select_one('div.col-sm-8') or spec.select_one('td:last-child') or spec.select_one('span')
+                    name_elem = spec.css_first(_SPEC_NAME_SEL) or spec.css_first('strong')
+                    value_elem = spec.css_first(_SPEC_VALUE_SEL) or spec.css_first('span')
                     
                     if name_elem and value_elem:
-                        name = name_elem.text.strip()
-                        value = value_elem.text.strip()
+                        name = name_elem.text().strip()
+                        value = value_elem.text().strip()
                         specs[name] = value
                 
-                self.debug_print(f"Found {len(specs)} specifications using selector: {selector}")
+                self.debug_print("Found %s specifications using selector: %s", len(specs), selector)
                 break
         
         product['specifications'] = specs
@@ -247,50 +377,29 @@ class JenniferFurnitureScraper:
         
         return product
     
-    def scrape_category_page(self, url):
-        """Scrape products from a category page"""
-        html = self.get_page_html(url)
-        if not html:
-            return []
-        
-        soup = BeautifulSoup(html, 'html.parser')
+    async def scrape_category_page(self, url, tree):
+        """Scrape products from an already parsed category page"""
         product_links = []
+        seen = set()
         
         # Try different selectors for product cards based on page structure
-        product_selectors = [
-            'div.product-layout div.product-thumb',
-            '.product-grid .product-card',
-            '.collection-grid .grid-product',
-            '.products-grid .product-item',
-            '.product-list .product',
-            'ul.products li.product',
-            '.grid-product__content',
-            'article[data-product]',
-            '.product-item',
-            '.grid__item',
-            '.product-card'
-        ]
-        
         product_cards = []
-        used_selector = None
-        
-        for selector in product_selectors:
-            product_cards = soup.select(selector)
+        for selector in _PRODUCT_CARD_SELECTORS:
+            product_cards = tree.css(selector)
             if product_cards:
-                used_selector = selector
-                self.debug_print(f"Found {len(product_cards)} product cards using selector: {selector}")
+                self.debug_print("Found %s product cards using selector: %s", len(product_cards), selector)
                 break
         
         # If no product cards found with predefined selectors, try to find any links with product-related classes
         if not product_cards:
-            product_cards = soup.select('a[href*="product"]') or soup.select('a[href*="/products/"]')
+            product_cards = tree.css('a[href*="product"]') or tree.css('a[href*="/products/"]')
             if product_cards:
-                self.debug_print(f"Found {len(product_cards)} product cards using href contains product")
+                self.debug_print("Found %s product cards using href contains product", len(product_cards))
         
         # Extract product links
         for card in product_cards:
             # Try to find direct link in card
-            if card.name == 'a' and card.get('href'):
+            if card.tag == 'a' and card.attributes.get('href'):
                 link_elem = card
             else:
                 # Try various selectors for links
@@ -310,121 +419,139 @@ class JenniferFurnitureScraper:
                 
                 link_elem = None
                 for selector in link_selectors:
-                    link_elem = card.select_one(selector)
-                    if link_elem and link_elem.get('href'):
+                    link_elem = card.css_first(selector)
+                    if link_elem and link_elem.attributes.get('href'):
                         break
             
-            if link_elem and link_elem.get('href'):
-                full_url = urljoin(self.base_url, link_elem.get('href'))
-                if full_url not in product_links:  # Avoid duplicates
+            if link_elem and link_elem.attributes.get('href'):
+                full_url = self._absolute_url(link_elem.attributes.get('href'))
+                if full_url not in seen:  # Avoid duplicates
+                    seen.add(full_url)
                     product_links.append(full_url)
         
-        self.debug_print(f"Found {len(product_links)} product links on page {url}")
+        self.debug_print("Found %s product links on page %s", len(product_links), url)
         
         # If no product links found yet, try to find all links that might be products
         if not product_links:
-            all_links = soup.find_all('a')
+            all_links = tree.css('a')
             for link in all_links:
-                href = link.get('href')
+                href = link.attributes.get('href')
                 if href and ('product' in href or '/p/' in href):
-                    full_url = urljoin(self.base_url, href)
-                    if full_url not in product_links:
+                    full_url = self._absolute_url(href)
+                    if full_url not in seen:
+                        seen.add(full_url)
                         product_links.append(full_url)
             
-            self.debug_print(f"Found {len(product_links)} product links using generic product link search")
+            self.debug_print("Found %s product links using generic product link search", len(product_links))
         
         print(f"Found {len(product_links)} products on page {url}")
         
-        products = []
-        for link in product_links:
-            product = self.parse_product_page(link)
-            if product:
-                products.append(product)
-                # Be nice to the server with a small delay
-                time.sleep(1)
+        # Product pages are independent, so fetch them concurrently; the
+        # semaphore and request slots in get_page_html keep us nice to the server
+        results = await asyncio.gather(*(self.parse_product_page(link) for link in product_links))
+        products = [product for product in results if product]
         
         return products
     
-    def get_next_page_url(self, url, html):
-        """Extract the next page URL if available"""
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Try different selectors for pagination
-        next_link_selectors = [
-            'ul.pagination li.active + li a',
-            '.pagination .next a',
-            'a.pagination__next',
-            'a[rel="next"]',
-            '.next-page a',
-            '.pagination-next a',
-            'a.next',
-            'a.next-page',
-            '.pagination .next',
-            '.pagination a:contains("Next")',
-            'a:contains("Next")'
-        ]
+    def get_next_page_url(self, url, tree):
+        """Extract the next page URL from a parsed page if available"""
+        
+        # Try the pagination-specific structures in one pass
+        for next_link in tree.css(_NEXT_LINK_SEL):
+            if next_link.attributes.get('href'):
+                next_url = self._absolute_url(next_link.attributes.get('href'))
+                self.debug_print("Found next page URL: %s", next_url)
+                return next_url
         
-        for selector in next_link_selectors:
-            if selector.endswith(':contains("Next")'):
-                # Handle special case for contains selector
-                selector_name = selector.split(':')[0]
-                elements = soup.select(selector_name)
-                next_link = None
-                for el in elements:
-                    if el.text.strip().lower() == 'next':
-                        next_link = el
-                        break
-            else:
-                next_link = soup.select_one(selector)
-            
-            if next_link and next_link.get('href'):
-                next_url = urljoin(self.base_url, next_link.get('href'))
-                self.debug_print(f"Found next page URL: {next_url} using selector: {selector}")
+        for selector in _GENERIC_NEXT_LINK_SELECTORS:
+            next_link = tree.css_first(selector)
+            if next_link and next_link.attributes.get('href'):
+                next_url = self._absolute_url(next_link.attributes.get('href'))
+                self.debug_print("Found next page URL: %s using selector: %s", next_url, selector)
+                return next_url
+        
+        # Lexbor has no :contains() pseudo-class, so match "Next" links by text
+        for a in tree.css('a'):
+            if a.text().strip().lower() == 'next' and a.attributes.get('href'):
+                next_url = self._absolute_url(a.attributes.get('href'))
+                self.debug_print("Found next page URL: %s using link text", next_url)
                 return next_url
         
         # Try to find pagination using regex patterns
-        pagination_pattern = re.compile(r'page=(\d+)')
-        current_page_match = pagination_pattern.search(url)
+        current_page_match = _PAGE_RE.search(url)
         if current_page_match:
             current_page = int(current_page_match.group(1))
             next_page = current_page + 1
-            next_url = re.sub(r'page=\d+', f'page={next_page}', url)
-            self.debug_print(f"Generated next page URL using regex: {next_url}")
+            next_url = _PAGE_RE.sub(f'page={next_page}', url)
+            self.debug_print("Generated next page URL using regex: %s", next_url)
             return next_url
         
         return None
     
-    def scrape_multiple_pages(self, start_url, max_pages=4):
-        """Scrape up to max_pages from the starting URL"""
+    async def scrape_multiple_pages(self, start_url, max_pages=4, json_filename=None):
+        """Scrape up to max_pages from the starting URL
+        
+        If json_filename is given, products are streamed to that file as a JSON
+        array after each page instead of being written by save_to_json at the end.
+        """
         current_url = start_url
         page_count = 0
+        json_file = open(json_filename, 'w', encoding='utf-8') if json_filename else None
+        written = 0
+        loop = asyncio.get_running_loop()
         
-        while current_url and page_count < max_pages:
-            print(f"Scraping page {page_count + 1}: {current_url}")
-            html = self.get_page_html(current_url)
-            if not html:
-                break
-            
-            # Scrape products from current page
-            products = self.scrape_category_page(current_url)
-            self.all_products.extend(products)
-            
-            # Find next page URL
-            next_url = self.get_next_page_url(current_url, html)
+        try:
+            if json_file:
+                json_file.write('[')
             
-            # Check if we're going to a different page
-            if next_url == current_url:
-                self.debug_print("Next URL is the same as current URL, stopping pagination")
-                break
+            while current_url and page_count < max_pages:
+                print(f"Scraping page {page_count + 1}: {current_url}")
+                html = await self.get_page_html(current_url)
+                if not html:
+                    break
                 
-            current_url = next_url
-            page_count += 1
-            
-            # Be nice to the server with a delay between pages
-            time.sleep(2)
+                # Parse once and share the tree between product and pagination lookups
+                tree = await loop.run_in_executor(None, LexborHTMLParser, html)
+                
+                # Scrape products from current page
+                products = await self.scrape_category_page(current_url, tree)
+                self.all_products.extend(products)
+                if json_file:
+                    written = self._write_json_products(json_file, products, written)
+                
+                # Find next page URL
+                next_url = self.get_next_page_url(current_url, tree)
+                
+                # Check if we're going to a different page
+                if next_url == current_url:
+                    self.debug_print("Next URL is the same as current URL, stopping pagination")
+                    break
+                    
+                current_url = next_url
+                page_count += 1
+                
+                # Be nice to the server with a delay between pages
+                await asyncio.sleep(2)
+        finally:
+            await self.close()
+            if json_file:
+                json_file.write('\n]' if written else ']')
+                json_file.close()
+                print(f"Saved {written} products to {json_filename}")
         
         return self.all_products
     
+    def _write_json_products(self, f, products, written):
+        """Append products to an open JSON array and return the new entry count"""
+        for product in products:
+            # Match the layout json.dump(..., indent=4) gives save_to_json
+            entry = json.dumps(product, indent=4, ensure_ascii=False)
+            f.write(',\n' if written else '\n')
+            f.write(textwrap.indent(entry, '    '))
+            written += 1
+        f.flush()
+        return written
+    
     def save_to_json(self, filename="jennifer_products.json"):
         """Save scraped products to JSON file"""
         with open(filename, 'w', encoding='utf-8') as f:
@@ -437,38 +564,36 @@ class JenniferFurnitureScraper:
             print("No products to save")
             return
         
-        # Get all possible fields from all products
-        fieldnames = ['title', 'price', 'original_price', 'sku', 'description', 'url']
-        
-        # Add specification fields
+        # Build the rows and collect the spec fields in a single pass
+        rows = []
         spec_fields = set()
         for product in self.all_products:
-            for spec in product.get('specifications', {}).keys():
-                spec_fields.add(f"spec_{spec}")
+            row = {
+                'title': product.get('title', ''),
+                'price': product.get('price', ''),
+                'original_price': product.get('original_price', ''),
+                'sku': product.get('sku', ''),
+                'description': product.get('description', ''),
+                'url': product.get('url', ''),
+                'images': '; '.join(product.get('images', []))
+            }
+            
+            # Add specifications
+            for spec_name, spec_value in product.get('specifications', {}).items():
+                spec_field = f"spec_{spec_name}"
+                row[spec_field] = spec_value
+                spec_fields.add(spec_field)
+            
+            rows.append(row)
         
+        fieldnames = ['title', 'price', 'original_price', 'sku', 'description', 'url']
         fieldnames.extend(sorted(spec_fields))
         fieldnames.append('images')
         
         with open(filename, 'w', encoding='utf-8', newline='') as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
-            
-            for product in self.all_products:
-                row = {
-                    'title': product.get('title', ''),
-                    'price': product.get('price', ''),
-                    'original_price': product.get('original_price', ''),
-                    'sku': product.get('sku', ''),
-                    'description': product.get('description', ''),
-                    'url': product.get('url', ''),
-                    'images': '; '.join(product.get('images', []))
-                }
-                
-                # Add specifications
-                for spec_name, spec_value in product.get('specifications', {}).items():
-                    row[f"spec_{spec_name}"] = spec_value
-                
-                writer.writerow(row)
+            writer.writerows(rows)
         
         print(f"Saved {len(self.all_products)} products to {filename}")
 
@@ -479,9 +604,9 @@ if __name__ == "__main__":
     # Use the collection URL you're trying to scrape
     start_url = "https://www.jenniferfurniture.com/collections/modern-heritage-mattresses.html"
     
-    # Scrape up to 4 pages
-    products = scraper.scrape_multiple_pages(start_url, max_pages=4)
+    # Scrape up to 4 pages, streaming products to JSON as they arrive
+    products = asyncio.run(scraper.scrape_multiple_pages(start_url, max_pages=4,
+                                                         json_filename="jennifer_products.json"))
     
     # Save results
-    scraper.save_to_json()
     scraper.save_to_csv()
\ No newline at end of file